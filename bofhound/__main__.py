@@ -44,6 +44,12 @@ def main(
         help="Compress the JSON output files into a zip archive"
     ),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress banner"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1,
+        help=("Number of worker processes used to parse log files in parallel. Each file is "
+              "parsed on its own, so a record split across two log files (e.g. rotated "
+              "beacon logs) is not reassembled. Mythic input is always parsed sequentially")
+    ),
     mythic_server: str = typer.Option(
         "127.0.0.1", "--mythic-server", help="IP or hostname of Mythic server to connect to",
         rich_help_panel="Mythic Options"
@@ -124,7 +130,8 @@ def main(
     with console.status("", spinner="aesthetic") as status:
         results = pipeline.process_data_source(
             data_source,
-            progress_callback=lambda id: status.update(f"Processing {id}")
+            progress_callback=lambda id: status.update(f"Processing {id}"),
+            workers=workers
         )
 
     ldap_objects = results.get_ldap_objects()
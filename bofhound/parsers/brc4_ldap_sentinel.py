@@ -11,14 +11,16 @@ class Brc4LdapSentinelParser(BoundaryBasedParser):
     BRC4 LDAP Sentinel currently only queries attributes=["*"] and objectClass
     is always the top result. May need to be updated in the future.
     """
-    FORMATTED_TS_ATTRS = [
+    FORMATTED_TS_ATTRS = frozenset({
         'lastlogontimestamp', 'lastlogon', 'lastlogoff', 'pwdlastset', 'accountexpires'
-    ]
-    ISO_8601_TS_ATTRS = ['dscorepropagationdata', 'whenchanged', 'whencreated']
-    BRACKETED_ATTRS = ['objectguid']
-    SEMICOLON_DELIMITED_ATTRS = [
+    })
+    ISO_8601_TS_ATTRS = frozenset({'dscorepropagationdata', 'whenchanged', 'whencreated'})
+    TS_ATTRS = FORMATTED_TS_ATTRS | ISO_8601_TS_ATTRS
+    BRACKETED_ATTRS = frozenset({'objectguid'})
+    SEMICOLON_DELIMITED_ATTRS = frozenset({
         'serviceprincipalname', 'memberof', 'member', 'objectclass', 'msds-allowedtodelegateto'
-    ]
+    })
+    UNSET_TS_VALUES = frozenset({'never expires', 'value not set', '0'})
 
     def __init__(self):
         super().__init__(start_boundary_pattern=f'+{"-" * 67}+')
@@ -43,7 +45,7 @@ class Brc4LdapSentinelParser(BoundaryBasedParser):
             try:
                 # BRc4 formats some timestamps for us that we need to revert to raw values
                 if key in Brc4LdapSentinelParser.FORMATTED_TS_ATTRS:
-                    if value.lower() in ['never expires', 'value not set', '0']:
+                    if value.lower() in Brc4LdapSentinelParser.UNSET_TS_VALUES:
                         continue
                     timestamp_obj = dt.strptime(value, '%m/%d/%Y %I:%M:%S %p')
                     value = int((timestamp_obj - dt(1601, 1, 1)).total_seconds() * 10000000)
@@ -76,10 +78,7 @@ class Brc4LdapSentinelParser(BoundaryBasedParser):
 
             except ValueError as e:
                 # Handle timestamp parsing errors specifically
-                if (key in
-                    Brc4LdapSentinelParser.FORMATTED_TS_ATTRS
-                    + Brc4LdapSentinelParser.ISO_8601_TS_ATTRS
-                ):
+                if key in Brc4LdapSentinelParser.TS_ATTRS:
                     logger.warning('Failed to parse timestamp for %s: %s. Error: %s', key, value, e)
                     # Keep original value or set to None based on requirements
                     processed_attributes[key] = value
@@ -106,11 +105,6 @@ class Brc4LdapSentinelParser(BoundaryBasedParser):
 
         return processed_attributes
 
-    def get_key_value(self, line:str) -> tuple[str, str]:
-        """Split line into key and value at the first colon"""
-        parts = line.split(":", 1)
-        key = parts[0].split(']')[1].strip().lower()
-        value = None
-        if len(parts) > 1:
-            value = parts[1].strip()
-        return key, value
+    def _canonical_key(self, raw_key: str) -> str:
+        """Drop the leading '[+]' status marker before normalizing the attribute name"""
+        return raw_key.split(']')[1].strip().lower()
@@ -1,11 +1,15 @@
 """Parsing pipeline to coordinate multiple tool parsers for C2 framework logs."""
-from typing import List, Dict, Any
+import copy
+import functools
+import multiprocessing
+from typing import List, Dict, Any, Tuple
 from .types import ObjectType, ToolParser
-from .data_sources import DataSource
+from .data_sources import DataSource, DataStream, FileDataSource, FileDataStream
 from . import (
     NetLocalGroupBofParser, NetLoggedOnBofParser, NetSessionBofParser, RegSessionBofParser,
     LdapSearchBofParser, ParserType, Brc4LdapSentinelParser
 )
+from bofhound.logger import logger
 
 class ParsingResult:
     """Container for categorized parsing results"""
@@ -44,6 +48,33 @@ class ParsingResult:
         return self.objects_by_type[ObjectType.PRIVILEGED_SESSION]
 
 
+def _parse_data_stream(
+    registered_parsers: List[ToolParser], task: Tuple[int, DataStream]
+) -> Tuple[int, List[Tuple[ObjectType, List[Dict[str, Any]]]]]:
+    """
+    Parse a single data stream with copies of the registered parsers.
+
+    Runs inside a worker process, so only non-empty results are returned to
+    keep the payload sent back to the parent small. The stream's index is
+    passed through so the parent can restore the original stream order.
+    """
+    index, data_stream = task
+    # A worker may be handed several streams with the same parsers; copy
+    # them so no state carries from one stream into the next
+    parsers = copy.deepcopy(registered_parsers)
+    line_handlers = [parser.process_line for parser in parsers]
+    for line in data_stream.lines():
+        for process_line in line_handlers:
+            process_line(line)
+
+    results = []
+    for parser in parsers:
+        parsed_objects = parser.get_results()
+        if parsed_objects:
+            results.append((parser.produces_object_type, parsed_objects))
+    return index, results
+
+
 class ParsingPipeline:
     """
     Coordinates multiple tool parsers to process C2 framework logs.
@@ -57,24 +88,39 @@ class ParsingPipeline:
         """Register a tool parser with the pipeline"""
         self.tool_parsers.append(parser)
 
-    def process_data_source(self, data_source: DataSource, progress_callback=None) -> ParsingResult:
+    def process_data_source(self, data_source: DataSource, progress_callback=None,
+                            workers: int = 1) -> ParsingResult:
         """
         Process a data source through all registered parsers.
 
+        When workers is greater than 1 and the data source is a
+        FileDataSource, files are parsed in parallel worker processes. Each
+        file then gets its own copy of the registered parsers, so records
+        cannot span two files. Other data sources, such as Mythic, split one
+        log into many streams and are always parsed sequentially.
+
         Returns categorized results.
         """
+        if workers > 1:
+            if isinstance(data_source, FileDataSource):
+                return self._process_data_source_parallel(data_source, progress_callback, workers)
+            logger.warning("Parallel parsing is only supported for log files, "
+                           "parsing sequentially")
+
+        return self._process_data_streams(data_source.get_data_streams(), progress_callback)
+
+    def _process_data_streams(self, data_streams, progress_callback) -> ParsingResult:
+        """Parse data streams one after another, sharing parser state between them."""
         result = ParsingResult()
+        line_handlers = [parser.process_line for parser in self.tool_parsers]
 
-        for data_stream in data_source.get_data_streams():
+        for data_stream in data_streams:
             if progress_callback:
                 progress_callback(data_stream.identifier)
             for line in data_stream.lines():
-                # Apply platform-specific filtering
-                filtered_line = line.rstrip('\n\r')
-
-                # Distribute line to all parsers that can handle it
-                for parser in self.tool_parsers:
-                    parser.process_line(filtered_line)
+                # Parsers strip each line themselves, including any line ending
+                for process_line in line_handlers:
+                    process_line(line)
 
         # Collect results from all parsers
         for parser in self.tool_parsers:
@@ -82,6 +128,43 @@ class ParsingPipeline:
 
         return result
 
+    def _process_data_source_parallel(self, data_source: DataSource, progress_callback,
+                                      workers: int) -> ParsingResult:
+        """Parse each data stream of a data source in a pool of worker processes."""
+        data_streams = list(data_source.get_data_streams())
+        if len(data_streams) < 2:
+            # A pool can't parse a single file any faster, it only adds the
+            # cost of copying the parsers and results between processes
+            return self._process_data_streams(data_streams, progress_callback)
+
+        result = ParsingResult()
+
+        # Schedule the largest streams first so a single big log doesn't end
+        # up running alone after every other worker has gone idle
+        tasks = sorted(
+            enumerate(data_streams), key=lambda task: task[1].size_hint, reverse=True
+        )
+
+        # Hand streams to workers in batches to amortize IPC when there are
+        # many more streams than workers
+        chunksize = max(1, len(data_streams) // (workers * 4))
+        worker = functools.partial(_parse_data_stream, self.tool_parsers)
+
+        stream_results = [None] * len(data_streams)
+        with multiprocessing.Pool(min(workers, len(data_streams))) as pool:
+            for index, parsed in pool.imap_unordered(worker, tasks, chunksize=chunksize):
+                if progress_callback:
+                    progress_callback(data_streams[index].identifier)
+                stream_results[index] = parsed
+
+        # Merge in the original stream order so objects are merged in the
+        # same order as a sequential run
+        for parsed in stream_results:
+            for obj_type, parsed_objects in parsed:
+                result.add_objects(obj_type, parsed_objects)
+
+        return result
+
     def process_file(self, file_path: str) -> ParsingResult:
         """
         Process a file through all registered parsers.
@@ -90,14 +173,10 @@ class ParsingPipeline:
         """
         result = ParsingResult()
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                # Apply platform-specific filtering
-                filtered_line = line.rstrip('\n\r')
-
-                # Distribute line to all parsers that can handle it
-                for parser in self.tool_parsers:
-                    parser.process_line(filtered_line)
+        line_handlers = [parser.process_line for parser in self.tool_parsers]
+        for line in FileDataStream(file_path).lines():
+            for process_line in line_handlers:
+                process_line(line)
 
         # Collect results from all parsers
         for parser in self.tool_parsers:
@@ -1,9 +1,10 @@
 """Parser types and base classes"""
 
 import re
+import sys
 from enum import Enum
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 from typing_extensions import override
 
 
@@ -39,6 +40,12 @@ class ToolParser(ABC):
     def process_line(self, line: str) -> None:
         """Process a single line of input"""
 
+    def process_lines(self, lines: Iterable[str]) -> None:
+        """Process every line from an iterable of lines, e.g. an open file"""
+        process_line = self.process_line
+        for line in lines:
+            process_line(line)
+
     @abstractmethod
     def get_results(self) -> List[Dict[str, Any]]:
         """Return all parsed objects and reset internal state"""
@@ -49,16 +56,73 @@ class BoundaryBasedParser(ToolParser):
 
     __skipped_marker = "<__NOISE_SKIPPED_LINE__>"
 
+    # Upper bound on cached attribute name spellings; continuation fragments
+    # that happen to contain a colon must not grow the cache without limit
+    _ATTRIBUTE_NAME_CACHE_SIZE = 4096
+
+    # Maps line classifier group names to the handler for that kind of line
+    _LINE_HANDLERS = {
+        "end": "_handle_end_boundary_line",
+        "skip": "_handle_skipped_line",
+    }
+
     def __init__(self, start_boundary_pattern: str, end_boundary_pattern: str = None):
         self._current_record_lines: List[str] = []
         self._records: List[Dict[str, Any]] = []
+        self._attribute_names: Dict[str, str] = {}
         self._parsing_state = ParsingState.WAITING_FOR_OBJECT
         self._start_boundary_detector = BoundaryDetector(start_boundary_pattern)
         self._end_boundary_detector = (
             BoundaryDetector(end_boundary_pattern) if end_boundary_pattern else None
         )
+        # While waiting for an object, only lines starting like a boundary can
+        # change this parser's state
+        self._boundary_first_chars = frozenset(
+            pattern[0] for pattern in (start_boundary_pattern, end_boundary_pattern) if pattern
+        )
+        self.__end_of_tool_output_pattern = None
         self._skippable_patterns = []
 
+    @property
+    def _skippable_patterns(self) -> tuple[str, ...]:
+        """Regex patterns for noise lines that should be skipped"""
+        return self.__skippable_patterns
+
+    @_skippable_patterns.setter
+    def _skippable_patterns(self, patterns: List[str]) -> None:
+        self.__skippable_patterns = tuple(patterns)
+        self._compile_line_classifier()
+
+    @property
+    def _end_of_tool_output_pattern(self) -> str | None:
+        """Regex pattern for a line that marks the end of the tool's output"""
+        return self.__end_of_tool_output_pattern
+
+    @_end_of_tool_output_pattern.setter
+    def _end_of_tool_output_pattern(self, pattern: str | None) -> None:
+        self.__end_of_tool_output_pattern = pattern
+        self._compile_line_classifier()
+
+    def _compile_line_classifier(self) -> None:
+        """
+        Fuse the end-of-output and skippable patterns into one regex so each
+        line is classified with a single match. The named group that matched
+        selects the handler from _LINE_HANDLERS.
+        """
+        alternatives = []
+        if self.__end_of_tool_output_pattern:
+            # End of output takes precedence over noise, so it is tried first
+            alternatives.append(f"(?P<end>{self.__end_of_tool_output_pattern})")
+        if self.__skippable_patterns:
+            skip = "|".join(f"(?:{pattern})" for pattern in self.__skippable_patterns)
+            alternatives.append(f"(?P<skip>{skip})")
+        self._line_classifier = re.compile("|".join(alternatives)) if alternatives else None
+        # Blank lines can never be a boundary, so unless a pattern claims them
+        # they go straight to the content handler
+        self._blank_is_content = (
+            self._line_classifier is None or self._line_classifier.match("") is None
+        )
+
     @override
     def process_line(self, line) -> None:
         """
@@ -66,8 +130,32 @@ class BoundaryBasedParser(ToolParser):
         """
         line = line.strip()
 
-        if self.should_skip_line(line):
-            self._handle_skipped_line()
+        # Unless a boundary is partially matched, only lines starting like a
+        # boundary can be one; for every other line the detectors are no-ops
+        may_be_boundary = (
+            line[:1] in self._boundary_first_chars
+            or self._start_boundary_detector.is_partial
+            or (self._end_boundary_detector is not None
+                and self._end_boundary_detector.is_partial)
+        )
+
+        # Most lines belong to another tool's output; when this parser is idle
+        # they can't affect it, so skip classification as well
+        if not may_be_boundary and self._parsing_state == ParsingState.WAITING_FOR_OBJECT:
+            return
+
+        if not line and self._blank_is_content:
+            self._handle_content_line(line)
+            return
+
+        if self._line_classifier is not None:
+            classified = self._line_classifier.match(line)
+            if classified is not None:
+                getattr(self, self._LINE_HANDLERS[classified.lastgroup])()
+                return
+
+        if not may_be_boundary:
+            self._handle_content_line(line)
             return
 
         start_boundary = self._start_boundary_detector.process_line(line)
@@ -101,7 +189,9 @@ class BoundaryBasedParser(ToolParser):
 
     def should_skip_line(self, line: str) -> bool:
         """Determine if a line should be skipped."""
-        return any(re.match(pattern, line) for pattern in self._skippable_patterns)
+        # Reuse the fused classifier rather than compiling the skip patterns twice
+        classified = self._line_classifier and self._line_classifier.match(line)
+        return bool(classified) and classified.lastgroup == "skip"
 
     def _handle_end_boundary_line(self) -> None:
         """Handle end of tool's output line"""
@@ -123,7 +213,7 @@ class BoundaryBasedParser(ToolParser):
         attributes = self._parse_lines_to_attributes()
         if attributes: # If not empty object
             self._records.append(attributes)
-        self._current_record_lines = []
+        self._current_record_lines.clear()
 
     def _handle_skipped_line(self) -> None:
         """Handle a line that should be skipped."""
@@ -140,33 +230,47 @@ class BoundaryBasedParser(ToolParser):
         in_attribute_key: bool = True
         current_attribute: str = ""
         attributes: Dict[str, Any] = {}
+        # Values split across output chunks (e.g. base64 security descriptors)
+        # collect their pieces here and are joined once the record is done
+        fragments: Dict[str, List[str]] = {}
+        skipped_marker = self.__skipped_marker
+        get_key_value = self.get_key_value
 
+        # Record lines were already stripped by process_line
         for line in self._current_record_lines:
-            line = line.strip()
-            if (line == ""
-                or line == self.__skipped_marker):
+            if not line or line == skipped_marker:
                 # This line is blank or was skipped as noise;
                 #  treat as break in previous message
                 break_in_previous_message = True
             else:
-                key, value = self.get_key_value(line)
+                key, value = get_key_value(line)
                 if break_in_previous_message:
                     break_in_previous_message = False
                     if in_attribute_key:
                         current_attribute += key
                         if value:
                             attributes[current_attribute] = value
+                            fragments.pop(current_attribute, None)
                             in_attribute_key = False
                     else:
-                        attributes[current_attribute] += line
+                        pieces = fragments.get(current_attribute)
+                        if pieces is None:
+                            fragments[current_attribute] = [attributes[current_attribute], line]
+                        else:
+                            pieces.append(line)
                 else:
                     current_attribute = key
                     if value:
                         attributes[key] = value
+                        if fragments:
+                            fragments.pop(key, None)
                         in_attribute_key = False
                     else:
                         in_attribute_key = True
 
+        for attribute, pieces in fragments.items():
+            attributes[attribute] = "".join(pieces)
+
         processed_attributes = self._post_process_attributes(attributes)
         return processed_attributes
 
@@ -174,14 +278,24 @@ class BoundaryBasedParser(ToolParser):
         """Post-process parsed attributes if needed"""
         return attributes
 
+    def _canonical_key(self, raw_key: str) -> str:
+        """Normalize the raw text before the first colon into an attribute name"""
+        return raw_key.strip().lower()
+
     def get_key_value(self, line:str) -> tuple[str, str]:
         """Split line into key and value at the first colon"""
-        parts = line.split(":", 1)
-        key = parts[0].strip().lower()
-        value = None
-        if len(parts) > 1:
-            value = parts[1].strip()
-        return key, value
+        key, sep, value = line.partition(":")
+        if not sep:
+            return self._canonical_key(key), None
+
+        # Attribute names repeat across every record, so remember the
+        # interned, canonical name for each raw spelling seen
+        attribute = self._attribute_names.get(key)
+        if attribute is None:
+            attribute = sys.intern(self._canonical_key(key))
+            if len(self._attribute_names) < self._ATTRIBUTE_NAME_CACHE_SIZE:
+                self._attribute_names[key] = attribute
+        return attribute, value.strip()
 
 
 class BoundaryResult(Enum):
@@ -200,6 +314,11 @@ class BoundaryDetector:
         self._accumulated_chars = 0
         self._target_length = len(boundary_pattern)
 
+    @property
+    def is_partial(self) -> bool:
+        """Whether the start of the boundary has matched and the rest is pending."""
+        return self._accumulated_chars > 0
+
     def process_line(self, line: str) -> BoundaryResult:
         """Process a line and return boundary detection result."""
         # clean_line = line.strip()
@@ -207,22 +326,20 @@ class BoundaryDetector:
         if not line:
             return BoundaryResult.NOT_BOUNDARY
 
-        # Check if this line could be part of the boundary pattern
-        remaining_pattern = self._boundary_pattern[self._accumulated_chars:]
+        # Fast path: the boundary almost always arrives whole on one line,
+        # which a single string comparison can confirm
+        if not self._accumulated_chars and line == self._boundary_pattern:
+            return BoundaryResult.COMPLETE_BOUNDARY
 
-        if remaining_pattern.startswith(line):
-            # This line matches the next part of the pattern
+        # Check if this line matches the next part of the boundary pattern,
+        # comparing in place rather than slicing off the remaining pattern
+        if self._boundary_pattern.startswith(line, self._accumulated_chars):
             self._accumulated_chars += len(line)
 
             if self._accumulated_chars == self._target_length:
-                self._reset()
+                self._accumulated_chars = 0
                 return BoundaryResult.COMPLETE_BOUNDARY
-            else:
-                return BoundaryResult.PARTIAL_BOUNDARY
-        else:
-            self._reset()
-            return BoundaryResult.NOT_BOUNDARY
+            return BoundaryResult.PARTIAL_BOUNDARY
 
-    def _reset(self) -> None:
-        """Reset accumulated character count."""
         self._accumulated_chars = 0
+        return BoundaryResult.NOT_BOUNDARY
@@ -1,9 +1,15 @@
 import os
 import json
-import codecs
 import datetime
-from zipfile import ZipFile
-from pathlib import PurePath, Path
+from contextlib import nullcontext
+from itertools import islice
+from zipfile import ZipFile, ZIP_DEFLATED
+from pathlib import PurePath
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from bofhound.logger import logger
 from bofhound import console
@@ -11,7 +17,12 @@ from bofhound.ad.models import BloodHoundDomain, BloodHoundComputer, BloodHoundU
 
 class BloodHoundWriter():
     files = []
-    ct = None
+    # Objects serialized per call when streaming a collection to its file
+    STREAM_BATCH_SIZE = 1000
+    # Collections whose meta block lists "methods" before "type"
+    METHODS_FIRST_TYPES = frozenset((
+        "enterprisecas", "aiacas", "rootcas", "ntauthstores", "issuancepolicies", "certtemplates"
+    ))
 
     @staticmethod
     def write(out_dir='.', domains=None, computers=None, users=None,
@@ -20,88 +31,62 @@ class BloodHoundWriter():
           trusts=None, trustaccounts=None, properties_level=2, zip_files=False):
 
         os.makedirs(out_dir, exist_ok=True)
-        BloodHoundWriter.ct = BloodHoundWriter.timestamp()
+        ct = BloodHoundWriter.timestamp()
+        # Only track the files written by this call
+        BloodHoundWriter.files = []
 
         outfiles = []
 
-        if domains is not None:
-            # print(BloodHoundSchema.ObjectTypeGuidMap)
-            with console.status(" [bold] Writing domains to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_domain_file(out_dir, domains, properties_level)
-                )
-
-        if computers is not None:
-            with console.status(" [bold] Writing computers to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_computers_file(out_dir, computers, properties_level)
-                )
-
-        if users is not None:
-            with console.status(" [bold] Writing users to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_users_file(out_dir, users, properties_level)
-                )
-
-        if groups is not None:
-            with console.status(" [bold] Writing groups to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_groups_file(out_dir, groups, properties_level)
-                )
-
-        if ous is not None:
-            with console.status(" [bold] Writing OUs to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_ous_file(out_dir, ous, properties_level)
-                )
-
-        if containers is not None:
-            with console.status(" [bold] Writing Containers to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_containers_file(out_dir, containers, properties_level)
-                )
-
-        if gpos is not None:
-            with console.status(" [bold] Writing GPOs to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_gpos_file(out_dir, gpos, properties_level)
-                )
-
-        if enterprisecas is not None:
-            with console.status(" [bold] Writing Enterprise CAs to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_enterprisecas_file(out_dir, enterprisecas, properties_level)
-                )
-
-        if aiacas is not None:
-            with console.status(" [bold] Writing AIA CAs to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_aiacas_file(out_dir, aiacas, properties_level)
-                )
-
-        if rootcas is not None:
-            with console.status(" [bold] Writing Root CAs to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_rootcas_file(out_dir, rootcas, properties_level)
-                )
-
-        if ntauthstores is not None:
-            with console.status(" [bold] Writing NTAuth Stores to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_ntauthstores_file(out_dir, ntauthstores, properties_level)
-                )
-
-        if issuancepolicies is not None:
-            with console.status(" [bold] Writing Issuance Policies to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_issuancepolicies_file(out_dir, issuancepolicies, properties_level)
-                )
-
-        if certtemplates is not None:
-            with console.status(" [bold] Writing Cert Templates to JSON...\n", spinner="aesthetic"):
-                outfiles.append(
-                    BloodHoundWriter.write_certtemplates_file(out_dir, certtemplates, properties_level)
-                )
+        collections = (
+            # (label, objects, writer)
+            ("domains", domains, BloodHoundWriter.write_domain_file),
+            ("computers", computers, BloodHoundWriter.write_computers_file),
+            ("users", users, BloodHoundWriter.write_users_file),
+            ("groups", groups, BloodHoundWriter.write_groups_file),
+            ("OUs", ous, BloodHoundWriter.write_ous_file),
+            ("Containers", containers, BloodHoundWriter.write_containers_file),
+            ("GPOs", gpos, BloodHoundWriter.write_gpos_file),
+            ("Enterprise CAs", enterprisecas, BloodHoundWriter.write_enterprisecas_file),
+            ("AIA CAs", aiacas, BloodHoundWriter.write_aiacas_file),
+            ("Root CAs", rootcas, BloodHoundWriter.write_rootcas_file),
+            ("NTAuth Stores", ntauthstores, BloodHoundWriter.write_ntauthstores_file),
+            ("Issuance Policies", issuancepolicies, BloodHoundWriter.write_issuancepolicies_file),
+            ("Cert Templates", certtemplates, BloodHoundWriter.write_certtemplates_file),
+        )
+
+        #
+        # When zipping, serialized collections are written straight into the
+        #  archive instead of to JSON files that are copied in and deleted.
+        #  BloodHound JSON is very repetitive, so even the fastest deflate
+        #  level shrinks it many times over.
+        #  The archive is built under a temporary name and moved into place
+        #  once complete, as the plain JSON files are, so a failed or
+        #  interrupted run never leaves a zip with a truncated member behind
+        #
+        zip_name = PurePath(out_dir, f"bloodhound_{ct}.zip") if zip_files else None
+        zip_tmp = f'{zip_name}.tmp' if zip_files else None
+        archive_context = (
+            ZipFile(zip_tmp, "w", compression=ZIP_DEFLATED, compresslevel=1)
+            if zip_files else nullcontext()
+        )
+        try:
+            with archive_context as archive:
+                for label, objects, write_file in collections:
+                    # Nothing to write for empty collections, so don't spin up a
+                    # status spinner for them either
+                    if not objects:
+                        continue
+                    with console.status(f" [bold] Writing {label} to JSON...\n",
+                                        spinner="aesthetic"):
+                        outfiles.append(
+                            write_file(out_dir, objects, properties_level, archive, ct)
+                        )
+            if zip_files:
+                os.replace(zip_tmp, zip_name)
+        except BaseException:
+            if zip_files and os.path.exists(zip_tmp):
+                os.unlink(zip_tmp)
+            raise
 
         if trusts is not None:
             outfiles.append(
@@ -113,18 +98,7 @@ class BloodHoundWriter():
                 BloodHoundWriter.write_trustaccounts_file(out_dir, trustaccounts, properties_level)
             )
 
-        if out_dir == ".":
-            logger.info(f'JSON files written to current directory')
-        else:
-            logger.info(f'JSON files written to {out_dir}')
-
         if zip_files:
-            zip_name = PurePath(out_dir, f"bloodhound_{BloodHoundWriter.ct}.zip")
-            with ZipFile(zip_name, "w") as zip:
-                for bh_file in BloodHoundWriter.files:
-                    zip.write(bh_file, bh_file.name)
-                    Path(bh_file).unlink()
-
             #
             # Single zipfile can be uploaded instad of all JSON files
             #  override outfiles list with the zip file
@@ -132,370 +106,206 @@ class BloodHoundWriter():
             outfiles = [zip_name]
 
             logger.info(f'Files compressed into {zip_name}')
+        elif out_dir == ".":
+            logger.info(f'JSON files written to current directory')
+        else:
+            logger.info(f'JSON files written to {out_dir}')
 
         # remove any 'None' entries from the outfiles list
         return [f for f in outfiles if f is not None]
 
 
     @staticmethod
-    def write_domain_file(out_dir, domains, properties_level):
-        if len(domains) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "type": "domains",
-                "count": 0,
-                "methods": 0,
-                "version": 5
-            }
-        }
-
-        for domain in domains:
-            datastruct['data'].append(domain.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'domains_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_domain_file(out_dir, domains, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, domains, "domains", 5, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_computers_file(out_dir, computers, properties_level):
-        if len(computers) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "type": "computers",
-                "count": 0,
-                "methods": 0,
-                "version": 6
-            }
-        }
-
-        for computer in computers:
-            datastruct['data'].append(computer.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'computers_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_computers_file(out_dir, computers, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, computers, "computers", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_users_file(out_dir, users, properties_level):
-        if len(users) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "type": "users",
-                "count": 0,
-                "methods": 0,
-                "version": 6
-            }
-        }
-
-        for user in users:
-            datastruct['data'].append(user.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'users_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_users_file(out_dir, users, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, users, "users", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_groups_file(out_dir, groups, properties_level):
-        if len(groups) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "type": "groups",
-                "count": 0,
-                "methods": 0,
-                "version": 6
-            }
-        }
-
-        for group in groups:
-            datastruct['data'].append(group.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'groups_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_groups_file(out_dir, groups, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, groups, "groups", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_ous_file(out_dir, ous, properties_level):
-        if len(ous) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "type": "ous",
-                "count": 0,
-                "methods": 0,
-                "version": 6
-            }
-        }
-
-        for ou in ous:
-            datastruct['data'].append(ou.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'ous_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_ous_file(out_dir, ous, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, ous, "ous", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_containers_file(out_dir, containers, properties_level):
-        if len(containers) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "type": "containers",
-                "count": 0,
-                "methods": 0,
-                "version": 6
-            }
-        }
-
-        for container in containers:
-            datastruct['data'].append(container.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'containers_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_containers_file(out_dir, containers, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, containers, "containers", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_gpos_file(out_dir, gpos, properties_level):
-        if len(gpos) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "type": "gpos",
-                "count": 0,
-                "methods": 0,
-                "version": 5
-            }
-        }
-
-        for gpo in gpos:
-            datastruct['data'].append(gpo.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'gpos_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_gpos_file(out_dir, gpos, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, gpos, "gpos", 5, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_enterprisecas_file(out_dir, enterprisecas, properties_level):
-        if len(enterprisecas) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "methods" : 0,
-                "type": "enterprisecas",
-                "count": 0,
-                "version": 6
-            }
-        }
-
-        for enterpriseca in enterprisecas:
-            datastruct['data'].append(enterpriseca.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'enterprisecas_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_enterprisecas_file(out_dir, enterprisecas, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, enterprisecas, "enterprisecas", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_aiacas_file(out_dir, aiacas, properties_level):
-        if len(aiacas) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "methods" : 0,
-                "type": "aiacas",
-                "count": 0,
-                "version": 6
-            }
-        }
-
-        for aiaca in aiacas:
-            datastruct['data'].append(aiaca.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'aiacas_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
-        return out_file
+    def write_aiacas_file(out_dir, aiacas, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, aiacas, "aiacas", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_rootcas_file(out_dir, rootcas, properties_level):
-        if len(rootcas) == 0:
-            return
+    def write_rootcas_file(out_dir, rootcas, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, rootcas, "rootcas", 6, properties_level, archive, ct
+        )
 
-        datastruct = {
-            "data": [],
-            "meta": {
-                "methods" : 0,
-                "type": "rootcas",
-                "count": 0,
-                "version": 6
-            }
-        }
-
-        for rootca in rootcas:
-            datastruct['data'].append(rootca.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'rootcas_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
 
-        return out_file
+    @staticmethod
+    def write_ntauthstores_file(out_dir, ntauthstores, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, ntauthstores, "ntauthstores", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_ntauthstores_file(out_dir, ntauthstores, properties_level):
-        if len(ntauthstores) == 0:
-            return
+    def write_issuancepolicies_file(out_dir, issuancepolicies, properties_level, archive=None,
+                                    ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, issuancepolicies, "issuancepolicies", 6, properties_level, archive, ct
+        )
 
-        datastruct = {
-            "data": [],
-            "meta": {
-                "methods" : 0,
-                "type": "ntauthstores",
-                "count": 0,
-                "version": 6
-            }
-        }
-
-        for ntauthstore in ntauthstores:
-            datastruct['data'].append(ntauthstore.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'ntauthstores_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
 
-        return out_file
+    @staticmethod
+    def write_certtemplates_file(out_dir, certtemplates, properties_level, archive=None, ct=None):
+        return BloodHoundWriter._write_collection(
+            out_dir, certtemplates, "certtemplates", 6, properties_level, archive, ct
+        )
 
 
     @staticmethod
-    def write_issuancepolicies_file(out_dir, issuancepolicies, properties_level):
-        if len(issuancepolicies) == 0:
-            return
-
-        datastruct = {
-            "data": [],
-            "meta": {
-                "methods" : 0,
-                "type": "issuancepolicies",
-                "count": 0,
-                "version": 6
-            }
-        }
-
-        for issuancepolicy in issuancepolicies:
-            datastruct['data'].append(issuancepolicy.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'issuancepolicies_{BloodHoundWriter.ct}.json')
-        BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
+    def write_trusts_file(out_dir, trusts, properties_level):
+        pass
 
-        return out_file
 
+    @staticmethod
+    def write_trustaccounts_file(out_dir, trustaccounts, properties_level):
+        pass
 
     @staticmethod
-    def write_certtemplates_file(out_dir, certtemplates, properties_level):
-        if len(certtemplates) == 0:
+    def _write_collection(out_dir, items, type_name, version, properties_level, archive=None,
+                          ct=None):
+        if len(items) == 0:
             return
 
-        datastruct = {
-            "data": [],
-            "meta": {
-                "methods": 0,
-                "type": "certtemplates",
-                "count": 0,
-                "version": 6
-            }
-        }
-
-        for certtemplate in certtemplates:
-            datastruct['data'].append(certtemplate.to_json(properties_level))
-            datastruct['meta']['count'] += 1
-
-        out_file = PurePath(out_dir, f'certtemplates_{BloodHoundWriter.ct}.json')
+        # Keep each collection's meta keys in the order BloodHound files
+        # have always been written with
+        if type_name in BloodHoundWriter.METHODS_FIRST_TYPES:
+            meta = {"methods": 0, "type": type_name, "count": len(items), "version": version}
+        else:
+            meta = {"type": type_name, "count": len(items), "methods": 0, "version": version}
+
+        if ct is None:
+            # write_*_file called directly, outside of write()
+            ct = BloodHoundWriter.timestamp()
+        file_name = f'{type_name}_{ct}.json'
+
+        if archive is not None:
+            # Closing the member on an exception still commits whatever was
+            # streamed so far; write() discards the whole archive in that case
+            with archive.open(file_name, 'w', force_zip64=True) as f:
+                BloodHoundWriter._write_json_stream(f, items, meta, properties_level)
+            return None
+
+        out_file = PurePath(out_dir, file_name)
+        # Write under a temporary name and move it into place, so an
+        # interrupted run never leaves a truncated JSON file to be uploaded
+        tmp_file = f'{out_file}.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                BloodHoundWriter._write_json_stream(f, items, meta, properties_level)
+            os.replace(tmp_file, out_file)
+        except BaseException:
+            # KeyboardInterrupt included, so no partial temp file is left behind
+            if os.path.exists(tmp_file):
+                os.unlink(tmp_file)
+            raise
+
+        # Only track the file once it is in place
         BloodHoundWriter.files.append(out_file)
-        with codecs.open(out_file, 'w', 'utf-8') as f:
-            json.dump(datastruct, f, ensure_ascii=False)
-
         return out_file
 
 
     @staticmethod
-    def write_trusts_file(out_dir, trusts, properties_level):
-        pass
+    def _write_json_stream(f, items, meta, properties_level):
+        """
+        Write {"data": [...], "meta": {...}} a batch of objects at a time, so a
+        large collection is never held in memory as a single serialized
+        document. The separators are chosen once per collection and every
+        batch is serialized with them, so the file is framed consistently
+        even if some batches have to fall back from orjson to json.
+        """
+        # orjson always writes compact JSON; json.dumps defaults otherwise
+        separators = (',', ':') if orjson is not None else (', ', ': ')
+        item_separator, key_separator = (sep.encode('utf-8') for sep in separators)
+
+        f.write(b'{"data"' + key_separator + b'[')
+        items = iter(items)
+        first_batch = True
+        while batch := [
+            item.to_json(properties_level)
+            for item in islice(items, BloodHoundWriter.STREAM_BATCH_SIZE)
+        ]:
+            if not first_batch:
+                f.write(item_separator)
+            first_batch = False
+            # Strip the brackets from the serialized list to splice its
+            # elements into the enclosing data array
+            f.write(BloodHoundWriter._serialize_json(batch, separators)[1:-1])
+        f.write(
+            b']' + item_separator + b'"meta"' + key_separator
+            + BloodHoundWriter._serialize_json(meta, separators) + b'}'
+        )
 
 
     @staticmethod
-    def write_trustaccounts_file(out_dir, trustaccounts, properties_level):
-        pass
+    def _serialize_json(datastruct, separators=(', ', ': ')):
+        # orjson is optional; it serializes several times faster than the
+        # stdlib and emits UTF-8 bytes directly
+        if orjson is not None:
+            try:
+                return orjson.dumps(datastruct)
+            except TypeError:
+                # value type orjson can't serialize, let json handle it below
+                pass
+
+        return json.dumps(
+            datastruct, ensure_ascii=False, separators=separators
+        ).encode('utf-8')
 
     @staticmethod
     def timestamp():
@@ -1,6 +1,38 @@
 """Mock implementation of the mythic module API calls."""
 
 import json
+import re
+from collections import defaultdict
+
+
+def _parse_return_attributes(tokens):
+    """Parse a GraphQL selection like "id,callback { id }" into {field: nested selection}."""
+    fields = {}
+    while tokens and tokens[0] != "}":
+        name = tokens.pop(0)
+        nested = None
+        if tokens and tokens[0] == "{":
+            tokens.pop(0)
+            nested = _parse_return_attributes(tokens)
+            tokens.pop(0)
+        fields[name] = nested
+    return fields
+
+
+def _project(record, fields):
+    """Keep only the requested fields of a record, as Mythic would return them."""
+    return {
+        name: record[name] if nested is None else _project(record[name], nested)
+        for name, nested in fields.items()
+        if name in record
+    }
+
+
+def _select(records, custom_return_attributes):
+    if custom_return_attributes is None:
+        return list(records)
+    fields = _parse_return_attributes(re.findall(r"[{}]|[^\s,{}]+", custom_return_attributes))
+    return [_project(record, fields) for record in records]
 
 
 class MockMythicAPI:
@@ -10,6 +42,16 @@ class MockMythicAPI:
         with open(test_data_file, 'r', encoding='utf-8') as f:
             self.test_data = json.load(f)
 
+        # Index tasks by callback and outputs by task up front so lookups
+        # don't rescan the whole fixture on every call
+        self._tasks_by_callback = defaultdict(list)
+        for task in self.test_data.get("tasks", []):
+            self._tasks_by_callback[task.get("callback", {}).get("display_id")].append(task)
+
+        self._outputs_by_task = defaultdict(list)
+        for output in self.test_data.get("outputs", []):
+            self._outputs_by_task[output.get("task", {}).get("display_id")].append(output)
+
     async def login(self, **kwargs):
         """Mock mythic.login() - just return a fake instance."""
         # Validate kwargs if needed
@@ -18,52 +60,39 @@ class MockMythicAPI:
 
         return "mock_mythic_instance"
 
-    async def get_all_callbacks(self, instance):
+    async def get_all_callbacks(self, instance, custom_return_attributes=None):
         """Mock mythic.get_all_callbacks() - return test callback data."""
         self._validate_mythic_instance(instance)
-        return self.test_data["callbacks"]
+        return _select(self.test_data["callbacks"], custom_return_attributes)
 
-    async def get_all_tasks(self, instance, callback_display_id):
+    async def get_all_tasks(self, instance, callback_display_id, custom_return_attributes=None):
         """Mock mythic.get_all_tasks() - filter tasks by callback_display_id."""
-        tasks = []
-
         self._validate_mythic_instance(instance)
-
-        # Filter tasks by callback display_id
-        for task in self.test_data.get("tasks", []):
-            if task.get("callback", {}).get("display_id") == callback_display_id:
-                tasks.append(task)
-
-        return tasks
+        return _select(
+            self._tasks_by_callback.get(callback_display_id, []), custom_return_attributes
+        )
 
     async def get_all_task_output_by_id(self, instance, task_id):
         """Mock mythic.get_all_task_output_by_id() - find output by task ID."""
-        outputs = []
-
         self._validate_mythic_instance(instance)
+        return list(self._outputs_by_task.get(task_id, []))
 
-        # Search outputs by task ID
-        for output in self.test_data.get("outputs", []):
-            if output.get("task", {}).get("display_id") == task_id:
-                # Return in the format the real API returns
-                outputs.append(output)
-
-        return outputs
+    async def execute_custom_query(self, instance, query, variables):
+        """Mock mythic.execute_custom_query() - serve task output queries by task display_id."""
+        self._validate_mythic_instance(instance)
+        return {"response": [
+            output
+            for task_id in variables["task_display_ids"]
+            for output in self._outputs_by_task.get(task_id, [])
+        ]}
 
     async def get_all_task_output(self, instance, batch_size=10):
         """Mock mythic.get_all_task_output() - yield all outputs."""
-        cursor = 0
         self._validate_mythic_instance(instance)
 
-        try:
-            while True:
-                batch = self.test_data.get("outputs", [])[cursor:cursor + batch_size]
-                if not batch:
-                    break
-                yield batch
-                cursor += batch_size
-        except Exception:
-            pass
+        outputs = self.test_data.get("outputs", [])
+        for cursor in range(0, len(outputs), batch_size):
+            yield outputs[cursor:cursor + batch_size]
 
     def _validate_mythic_instance(self, instance=None):
         if not instance:
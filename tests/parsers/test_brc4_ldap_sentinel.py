@@ -1,6 +1,7 @@
 """Tests for BRC4 LDAP Sentinel parser."""
 from bofhound.ad.models.bloodhound_computer import BloodHoundComputer
 from bofhound.ad.adds import ADDS
+from bofhound.parsers.data_sources import FileDataStream
 from bofhound.parsers import Brc4LdapSentinelParser
 from tests.test_data import (
     brc4ldapsentinel_standard_file_1030
@@ -10,9 +11,7 @@ from tests.test_data import (
 def test_parse_sentinel_standard_file(brc4ldapsentinel_standard_file_1030):
     """Test parsing of a normal BRC4 LDAP Sentinel file."""
     parser = Brc4LdapSentinelParser()
-    with open(brc4ldapsentinel_standard_file_1030, 'r', encoding='utf-8') as f:
-        for line in f:
-            parser.process_line(line)
+    parser.process_lines(FileDataStream(brc4ldapsentinel_standard_file_1030).lines())
     parsed_objects = parser.get_results()
     assert len(parsed_objects) == 1030
 
@@ -63,8 +62,7 @@ def test_parse_data_computer():
 +-------------------------------------------------------------------+
     """
     parser = Brc4LdapSentinelParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
 
     assert len(parsed_objects) == 1
@@ -118,8 +116,7 @@ def test_parse_lower_data_computer():
 +-------------------------------------------------------------------+
     """
     parser = Brc4LdapSentinelParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
     ad = ADDS()
     ad.import_objects(parsed_objects)
@@ -175,8 +172,7 @@ def test_parse_data_computer_data_missing_dn():
 +-------------------------------------------------------------------+
     """
     parser = Brc4LdapSentinelParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
     ad = ADDS()
     ad.import_objects(parsed_objects)
@@ -50,6 +50,25 @@ def test_single_file_data_source(tmp_path):
     lines = list(data_streams[0].lines())
     assert lines == ["onlyline1", "onlyline2"]
 
+def test_file_data_stream_line_endings(tmp_path):
+    """Test FileDataStream with empty files, CRLF and CR endings and no trailing newline."""
+    empty = tmp_path / "empty.log"
+    empty.write_bytes(b"")
+    assert list(next(FileDataSource(str(empty)).get_data_streams()).lines()) == []
+
+    crlf = tmp_path / "crlf.log"
+    crlf.write_bytes(b"first\r\nsecond\r\nlast")
+    assert list(next(FileDataSource(str(crlf)).get_data_streams()).lines()) == [
+        "first", "second", "last"
+    ]
+
+    # A lone CR ends a line, as it does with universal newlines
+    mixed = tmp_path / "mixed.log"
+    mixed.write_bytes(b"first\rsecond\r\rthird\r\nfourth\nlast\r")
+    assert list(next(FileDataSource(str(mixed)).get_data_streams()).lines()) == [
+        "first", "second", "", "third", "fourth", "last"
+    ]
+
 
 @pytest.fixture
 def mock_mythic_api():
@@ -142,6 +161,19 @@ def test_mythic_integration_full_pipeline(mock_mythic_module):
     assert stream_count == 16
     assert total_lines == 4587
 
+def test_mythic_data_source_ignores_workers(mock_mythic_module):
+    """Test that Mythic outputs are parsed sequentially even when workers are requested."""
+    pipeline = ParsingPipeline()
+    pipeline.register_parser(LdapSearchBofParser())
+
+    with patch('bofhound.parsers.parsing_pipeline.multiprocessing.Pool') as pool:
+        result = pipeline.process_data_source(
+            MythicDataSource("fake-server", "fake-token"), workers=4
+        )
+
+    pool.assert_not_called()
+    assert len(result.get_ldap_objects()) == 237
+
 
 def test_mock_mythic_api_structure():
     """Test that mock API returns data in expected structure."""
@@ -2,19 +2,18 @@
 from bofhound.ad.models.bloodhound_computer import BloodHoundComputer
 from bofhound.parsers import LdapSearchBofParser
 from bofhound.ad.adds import ADDS
+from bofhound.parsers.data_sources import FileDataStream
 from tests.test_data import (
     ldapsearchbof_standard_file_257,
     ldapsearchpy_standard_file_516,
-    ldapsearchbof_standard_file_2052,
+    testdata_ldapsearchbof_beacon_2052_objects,
     ldapsearchbof_standard_file_marvel
 )
 
 def test_parse_file_ldapsearchpy_normal_file(ldapsearchpy_standard_file_516):
     """Test parsing of a normal LDAP search file (pyldapsearch)."""
     parser = LdapSearchBofParser()
-    with open(ldapsearchpy_standard_file_516, 'r', encoding='utf-8') as f:
-        for line in f:
-            parser.process_line(line)
+    parser.process_lines(FileDataStream(ldapsearchpy_standard_file_516).lines())
     parsed_objects = parser.get_results()
     assert len(parsed_objects) == 451
 
@@ -22,27 +21,36 @@ def test_parse_file_ldapsearchpy_normal_file(ldapsearchpy_standard_file_516):
 def test_parse_file_ldapsearchbof_normal_file(ldapsearchbof_standard_file_257):
     """Test parsing of a normal LDAP search file (ldapsearchbof)."""
     parser = LdapSearchBofParser()
-    with open(ldapsearchbof_standard_file_257, 'r', encoding='utf-8') as f:
-        for line in f:
-            parser.process_line(line)
+    parser.process_lines(FileDataStream(ldapsearchbof_standard_file_257).lines())
     parsed_objects = parser.get_results()
     assert len(parsed_objects) == 224
 
-def test_parse_file_ldapsearchbof_large_file(ldapsearchbof_standard_file_2052):
+def test_parse_raw_lines_matches_file_data_stream(ldapsearchbof_standard_file_257):
+    """Test that parsers strip raw lines, including line endings, themselves."""
+    expected = LdapSearchBofParser()
+    expected.process_lines(FileDataStream(ldapsearchbof_standard_file_257).lines())
+
+    # Text-mode file iteration keeps each line's "\n"
+    raw = LdapSearchBofParser()
+    with open(ldapsearchbof_standard_file_257, 'r', encoding='utf-8') as f:
+        raw.process_lines(f)
+
+    padded = LdapSearchBofParser()
+    padded.process_lines(
+        f"  {line}\t\r\n" for line in FileDataStream(ldapsearchbof_standard_file_257).lines()
+    )
+
+    assert raw.get_results() == expected.get_results()
+    assert padded.get_results() == expected.get_results()
+
+def test_parse_file_ldapsearchbof_large_file(testdata_ldapsearchbof_beacon_2052_objects):
     """Test parsing of a normal LDAP search file (ldapsearchbof)."""
-    parser = LdapSearchBofParser()
-    with open(ldapsearchbof_standard_file_2052, 'r', encoding='utf-8') as f:
-        for line in f:
-            parser.process_line(line)
-    parsed_objects = parser.get_results()
-    assert len(parsed_objects) == 2052
+    assert len(testdata_ldapsearchbof_beacon_2052_objects) == 2052
 
 def test_parse_file_marvel(ldapsearchbof_standard_file_marvel):
     """Test parsing of a normal LDAP search file (ldapsearchbof)."""
     parser = LdapSearchBofParser()
-    with open(ldapsearchbof_standard_file_marvel, 'r', encoding='utf-8') as f:
-        for line in f:
-            parser.process_line(line)
+    parser.process_lines(FileDataStream(ldapsearchbof_standard_file_marvel).lines())
     parsed_objects = parser.get_results()
     assert len(parsed_objects) == 327
 
@@ -69,8 +77,7 @@ received output:
 PwdCount: 0
 codePage: 0"""
     parser = LdapSearchBofParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
     assert len(parsed_objects) == 2
     for obj in parsed_objects:
@@ -126,8 +133,7 @@ ms-Mcs-AdmPwdExpirationTime: 13295315246991474
 --------------------
     """
     parser = LdapSearchBofParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
 
     assert len(parsed_objects) == 1
@@ -185,8 +191,7 @@ ms-mcs-admpwdexpirationtime: 13295315246991474
 --------------------
     """
     parser = LdapSearchBofParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
     adds = ADDS()
     adds.import_objects(parsed_objects)
@@ -247,8 +252,7 @@ ms-Mcs-AdmPwdExpirationTime: 13295315246991474
 --------------------
     """
     parser = LdapSearchBofParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
     adds = ADDS()
     adds.import_objects(parsed_objects)
@@ -268,8 +272,7 @@ sAMAccountType: 805306369
 --------------------
     """
     parser = LdapSearchBofParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
     adds = ADDS()
     adds.import_objects(parsed_objects)
@@ -364,11 +367,17 @@ name: Domain Admins
 --------------------
     """
     parser = LdapSearchBofParser()
-    for line in data.splitlines(keepends=True):
-        parser.process_line(line)
+    parser.process_lines(data.splitlines())
     parsed_objects = parser.get_results()
 
     assert len(parsed_objects) == 1
     assert parsed_objects[0]['distinguishedname'] == 'CN=WIN10,OU=Workstations,DC=windomain,DC=local'
     assert parsed_objects[0]['objectsid'] == 'S-1-5-21-3674311734-1768984491-1162443153-1104'
     assert parsed_objects[0]['ntsecuritydescriptor'] == 'B64ENCODEDBINARYDATAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABACKHALFOFNTSECURITYDESCRIPTOR=='
+
+def test_should_skip_line():
+    """Test that noise lines are reported as skippable and end-of-output lines are not."""
+    parser = LdapSearchBofParser()
+    assert parser.should_skip_line("received output:")
+    assert not parser.should_skip_line("retrieved 5 results")
+    assert not parser.should_skip_line("name: Domain Admins")
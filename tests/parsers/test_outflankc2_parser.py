@@ -1,5 +1,6 @@
 """Tests for OutflankC2 parser."""
-from bofhound.parsers import LdapSearchBofParser
+import json
+from bofhound.parsers import LdapSearchBofParser, data_sources
 from bofhound.parsers.data_sources import FileDataSource, OutflankDataStream
 from tests.test_data import outflankc2_standard_file
 
@@ -10,7 +11,18 @@ def test_parse_file_outflankc2_standard_file(outflankc2_standard_file):
     data_source = FileDataSource(outflankc2_standard_file,
                                  stream_type=OutflankDataStream)
     for stream in data_source.get_data_streams():
-        for line in stream.lines():
-            parser.process_line(line)
+        parser.process_lines(stream.lines())
+    parsed_objects = parser.get_results()
+    assert len(parsed_objects) == 2052
+
+
+def test_parse_file_outflankc2_standard_file_without_orjson(outflankc2_standard_file, monkeypatch):
+    """Test parsing of the OutflankC2 standard file with the stdlib JSON decoder."""
+    monkeypatch.setattr(data_sources, "_json_loads", json.loads)
+    parser = LdapSearchBofParser()
+    data_source = FileDataSource(outflankc2_standard_file,
+                                 stream_type=OutflankDataStream)
+    for stream in data_source.get_data_streams():
+        parser.process_lines(stream.lines())
     parsed_objects = parser.get_results()
     assert len(parsed_objects) == 2052
@@ -1,11 +1,14 @@
 """Tests for LDAP Search BOF parser."""
+import os
+from unittest.mock import patch
 from bofhound.parsers import (
-    ParsingPipeline, ParsingResult, BoundaryDetector, BoundaryResult,
+    ParsingPipeline, ParsingPipelineFactory, ParsingResult, BoundaryDetector, BoundaryResult,
     LdapSearchBofParser
 )
 from bofhound.parsers.data_sources import FileDataSource
+from bofhound.parsers.types import ObjectType
 from tests.test_data import (
-    ldapsearchpy_standard_file_516
+    TEST_DATA_DIR, ldapsearchpy_standard_file_516
 )
 
 def test_parse_file_ldapsearchpy_normal_file(ldapsearchpy_standard_file_516):
@@ -16,6 +19,54 @@ def test_parse_file_ldapsearchpy_normal_file(ldapsearchpy_standard_file_516):
     parsed_objects: ParsingResult = pipeline.process_data_source(data_source)
     assert len(parsed_objects.get_ldap_objects()) == 451
 
+def test_parse_directory_parallel_matches_sequential():
+    """Test that parallel parsing of many files matches a sequential run of each file."""
+    input_path = os.path.join(TEST_DATA_DIR, "ldapsearchbof_logs")
+    data_source = FileDataSource(input_path)
+
+    # Each file gets its own parsers in parallel mode, so the reference is a
+    # sequential run per file rather than one run over the whole directory,
+    # where a record left open at the end of a file carries into the next
+    sequential = ParsingResult()
+    for data_stream in data_source.get_data_streams():
+        per_file = ParsingPipelineFactory.create_pipeline().process_data_source(
+            FileDataSource(data_stream.identifier)
+        )
+        for obj_type in ObjectType:
+            sequential.add_objects(obj_type, per_file.get_objects_by_type(obj_type))
+
+    parallel = ParsingPipelineFactory.create_pipeline().process_data_source(
+        data_source, workers=3
+    )
+    for obj_type in ObjectType:
+        assert parallel.get_objects_by_type(obj_type) == sequential.get_objects_by_type(obj_type)
+
+def test_parallel_single_file_parses_sequentially(ldapsearchpy_standard_file_516):
+    """Test that a single file is parsed without starting a worker pool."""
+    pipeline = ParsingPipeline()
+    pipeline.register_parser(LdapSearchBofParser())
+
+    with patch('bofhound.parsers.parsing_pipeline.multiprocessing.Pool') as pool:
+        parsed_objects = pipeline.process_data_source(
+            FileDataSource(ldapsearchpy_standard_file_516), workers=4
+        )
+
+    pool.assert_not_called()
+    assert len(parsed_objects.get_ldap_objects()) == 451
+
+def test_parallel_uses_registered_parser_instances(tmp_path):
+    """Test that worker processes parse with copies of the registered parser instances."""
+    for name in ("first.log", "second.log"):
+        (tmp_path / name).write_text("--------------------\nname: value\n")
+
+    parser = LdapSearchBofParser()
+    parser._skippable_patterns = [r"^name: "]  # pylint: disable=protected-access
+    pipeline = ParsingPipeline()
+    pipeline.register_parser(parser)
+
+    parsed_objects = pipeline.process_data_source(FileDataSource(str(tmp_path)), workers=2)
+    assert not parsed_objects.get_ldap_objects()
+
 def test_boundary_detection():
     """Test the BoundaryDetector with various scenarios."""
     detector = BoundaryDetector("-" * 20)
@@ -0,0 +1,54 @@
+"""Tests for the Mythic data capture utility."""
+import json
+from unittest.mock import patch
+
+import pytest
+from utilities import mythic_data_capture
+from tests.mocks.mock_mythic_api import MockMythicAPI
+
+TEST_DATA_PATH = "tests/test_data/mythic_logs/test_mythic_data.json"
+
+
+@pytest.fixture
+def mock_capture_mythic():
+    """Patch the mythic module used by the capture utility with the mock implementation."""
+    mock_mythic_api = MockMythicAPI(TEST_DATA_PATH)
+    with patch.object(mythic_data_capture, "mythic") as mock_mythic:
+        mock_mythic.login = mock_mythic_api.login
+        mock_mythic.get_all_callbacks = mock_mythic_api.get_all_callbacks
+        mock_mythic.get_all_tasks = mock_mythic_api.get_all_tasks
+        mock_mythic.execute_custom_query = mock_mythic_api.execute_custom_query
+        yield mock_mythic
+
+
+async def test_capture_requests_only_task_return_attributes(mock_capture_mythic, tmp_path):
+    """Test that a capture only keeps the task columns in TASK_RETURN_ATTRIBUTES."""
+    out_file = tmp_path / "capture.json"
+
+    await mythic_data_capture.capture_mythic_data("fake-server", "fake-token", out_file)
+
+    with open(TEST_DATA_PATH, "r", encoding="utf-8") as f:
+        test_data = json.load(f)
+    with open(out_file, "r", encoding="utf-8") as f:
+        captured = json.load(f)
+
+    assert len(captured["tasks"]) == len(test_data["tasks"])
+    for task in captured["tasks"]:
+        assert set(task) == {
+            "id", "display_id", "callback", "command_name", "status", "completed", "timestamp"
+        }
+        assert set(task["callback"]) == {"id", "display_id"}
+
+    assert captured["outputs"] == test_data["outputs"]
+
+
+def test_dumps_json_without_orjson(monkeypatch):
+    """Test that captures fall back to the stdlib when orjson isn't installed."""
+    data = {"outputs": [{"id": 1, "response_text": "ÜSER"}]}
+    expected = mythic_data_capture.dumps_json(data)
+
+    monkeypatch.setattr(mythic_data_capture, "orjson", None)
+    fallback = mythic_data_capture.dumps_json(data)
+
+    assert isinstance(fallback, bytes)
+    assert json.loads(fallback) == json.loads(expected) == data
@@ -0,0 +1,124 @@
+"""Tests for writing BloodHound JSON collections."""
+import json
+import os
+from zipfile import ZipFile, ZIP_DEFLATED
+
+import pytest
+from bofhound import writer
+from bofhound.writer import BloodHoundWriter
+
+# Spans more than one streaming batch, with a partial batch at the end
+NUM_OBJECTS = BloodHoundWriter.STREAM_BATCH_SIZE * 2 + 5
+
+
+class FakeObject:
+    """Minimal stand-in for a BloodHound model object."""
+
+    def __init__(self, index):
+        self.index = index
+
+    def to_json(self, properties_level):
+        return {
+            "ObjectIdentifier": f"S-1-5-21-1-{self.index}",
+            "Properties": {"name": f"ÜSER{self.index}@MARVEL.LOCAL", "level": properties_level},
+        }
+
+
+class UnserializableObject(FakeObject):
+    """Model object whose JSON can't be serialized."""
+
+    def to_json(self, properties_level):
+        return {"value": object()}
+
+
+def expected_data(properties_level=2):
+    return [FakeObject(i).to_json(properties_level) for i in range(NUM_OBJECTS)]
+
+
+def test_write_users_file_streams_batches(tmp_path):
+    """Test that a collection larger than one batch is written as a single valid document."""
+    users = [FakeObject(i) for i in range(NUM_OBJECTS)]
+
+    out_file = BloodHoundWriter.write_users_file(str(tmp_path), users, 2, ct="20260101_000000")
+
+    assert str(out_file) == os.path.join(tmp_path, "users_20260101_000000.json")
+    assert os.listdir(tmp_path) == ["users_20260101_000000.json"]
+    with open(out_file, encoding="utf-8") as f:
+        written = json.load(f)
+
+    assert written["data"] == expected_data()
+    assert written["meta"] == {
+        "type": "users", "count": NUM_OBJECTS, "methods": 0, "version": 6
+    }
+    assert list(written["meta"]) == ["type", "count", "methods", "version"]
+
+
+def test_write_zip_streams_batches(tmp_path):
+    """Test that zipped collections are deflated into the archive and nothing else is left."""
+    users = [FakeObject(i) for i in range(NUM_OBJECTS)]
+    certtemplates = [FakeObject(i) for i in range(3)]
+
+    outfiles = BloodHoundWriter.write(
+        str(tmp_path), users=users, certtemplates=certtemplates, zip_files=True
+    )
+
+    assert len(outfiles) == 1
+    assert os.listdir(tmp_path) == [outfiles[0].name]
+    with ZipFile(outfiles[0]) as archive:
+        names = sorted(archive.namelist())
+        assert [name.split("_")[0] for name in names] == ["certtemplates", "users"]
+        assert all(info.compress_type == ZIP_DEFLATED for info in archive.infolist())
+
+        users_json = json.loads(archive.read(names[1]))
+        certtemplates_json = json.loads(archive.read(names[0]))
+
+    assert users_json["data"] == expected_data()
+    assert users_json["meta"] == {
+        "type": "users", "count": NUM_OBJECTS, "methods": 0, "version": 6
+    }
+    assert certtemplates_json["data"] == [FakeObject(i).to_json(2) for i in range(3)]
+    assert list(certtemplates_json["meta"].items()) == [
+        ("methods", 0), ("type", "certtemplates"), ("count", 3), ("version", 6)
+    ]
+
+
+def test_write_users_file_without_orjson(tmp_path, monkeypatch):
+    """Test that the stdlib fallback writes the same document when orjson isn't installed."""
+    monkeypatch.setattr(writer, "orjson", None)
+    users = [FakeObject(i) for i in range(NUM_OBJECTS)]
+
+    out_file = BloodHoundWriter.write_users_file(str(tmp_path), users, 2)
+
+    with open(out_file, "rb") as f:
+        raw = f.read()
+    assert raw.startswith(b'{"data": [{"ObjectIdentifier": ')
+    assert "ÜSER0@MARVEL.LOCAL".encode("utf-8") in raw
+
+    written = json.loads(raw)
+    assert written["data"] == expected_data()
+    assert written["meta"] == {
+        "type": "users", "count": NUM_OBJECTS, "methods": 0, "version": 6
+    }
+
+
+def test_write_failure_removes_temp_file(tmp_path):
+    """Test that a failed write leaves neither a temp file nor a tracked output file."""
+    BloodHoundWriter.files = []
+    users = [FakeObject(i) for i in range(5)] + [UnserializableObject(5)]
+
+    with pytest.raises(TypeError):
+        BloodHoundWriter.write_users_file(str(tmp_path), users, 2)
+
+    assert not os.listdir(tmp_path)
+    assert not BloodHoundWriter.files
+
+
+def test_zip_write_failure_removes_archive(tmp_path):
+    """Test that a failed zipped write leaves neither a temp nor a final archive behind."""
+    users = [FakeObject(i) for i in range(NUM_OBJECTS)] + [UnserializableObject(NUM_OBJECTS)]
+    domains = [FakeObject(i) for i in range(3)]
+
+    with pytest.raises(TypeError):
+        BloodHoundWriter.write(str(tmp_path), domains=domains, users=users, zip_files=True)
+
+    assert not os.listdir(tmp_path)
@@ -6,27 +6,35 @@ import subprocess
 import json
 from pathlib import Path
 
-def run_benchmark(input_path, output_dir, iterations=3):
-    """Run bofhound and measure execution time."""
+def run_benchmark(input_path, output_dir, iterations=3, warmup=1):
+    """Run bofhound and measure execution time.
+
+    The first `warmup` runs are discarded so cold file caches and bytecode
+    compilation don't skew the results.
+    """
+    # Run the module with this interpreter directly; `poetry run` re-resolves
+    # the virtualenv on every call and that overhead ends up in the timings
+    command = [sys.executable, "-m", "bofhound", "-i", input_path, "-o", output_dir, "-q"]
     times = []
 
-    for i in range(iterations):
-        print(f"Run {i+1}/{iterations}...")
-        start = time.time()
+    for i in range(warmup + iterations):
+        if i < warmup:
+            print(f"Warmup {i+1}/{warmup}...")
+        else:
+            print(f"Run {i+1-warmup}/{iterations}...")
+        start = time.perf_counter()
 
-        result = subprocess.run(
-            ["poetry", "run", "bofhound", "-i", input_path, "-o", output_dir, "-q"],
-            capture_output=True,
-            text=True
-        )
+        result = subprocess.run(command, capture_output=True, text=True)
 
-        elapsed = time.time() - start
-        times.append(elapsed)
+        elapsed = time.perf_counter() - start
 
         if result.returncode != 0:
             print(f"Error: {result.stderr}")
             sys.exit(1)
 
+        if i >= warmup:
+            times.append(elapsed)
+
     avg = sum(times) / len(times)
     min_time = min(times)
     max_time = max(times)
@@ -9,95 +9,116 @@ and converts them to the OutflankC2 JSON format for testing purposes.
 import json
 import re
 from pathlib import Path
-from typing import List, Dict, Optional
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional
 
+READ_BUFFER_SIZE = 256 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
 
-def parse_beacon_log(log_file_path: str) -> List[Dict[str, str]]:
+COMMAND_PREFIX = '[input] <neo> '
+LDAPSEARCH_INPUT_MARKER = COMMAND_PREFIX + 'ldapsearch'
+
+
+def parse_beacon_log(log_file_path: str) -> Iterator[Dict[str, str]]:
     """
     Parse beacon log file and extract ldapsearch operations.
     
     Args:
         log_file_path: Path to the beacon log file
         
-    Returns:
-        List of dictionaries containing ldapsearch data
+    Yields:
+        Dictionaries containing ldapsearch data, one per operation as soon
+        as it has been read
     """
-    ldapsearch_operations = []
-    
-    with open(log_file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Look for ldapsearch input command
-        if '[input] <neo> ldapsearch' in line:
-            print(f"Found ldapsearch command at line {i + 1}: {line}")
-            
-            # Extract the command for reference
-            command = line.split('[input] <neo> ')[1]
-            
-            # Skip to the output sections
-            i += 1
-            output_lines = []
-            collecting_output = False
-            
-            while i < len(lines):
-                current_line = lines[i]
-                
+    # State of the ldapsearch operation currently being read, if any
+    command = None
+    collecting_output = False
+    output_lines = []
+
+    # Stream the log instead of loading it whole; beacon logs can be large
+    with open(log_file_path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+        for line_number, current_line in enumerate(f, 1):
+            if command is not None:
+                # Every marker below contains '[' or 'retreived'; plain output
+                # content, the bulk of a log, skips the marker searches
+                may_be_marker = '[' in current_line or 'retreived' in current_line
+
                 # Start collecting when we see [output]
-                if '[output]' in current_line:
+                if may_be_marker and '[output]' in current_line:
                     collecting_output = True
-                    i += 1
                     continue
-                
-                # Stop collecting when we hit retreived results or next command
-                if collecting_output:
+
+                if not collecting_output:
+                    continue
+
+                if may_be_marker:
+                    # Stop collecting when we hit retreived results or next command
                     if 'retreived' in current_line and 'results total' in current_line:
-                        # Include the results line and break
+                        # Include the results line and finish the operation
                         output_lines.append(current_line.strip())
-                        print(f"Found end of ldapsearch at line {i + 1}: {current_line.strip()}")
-                        break
-                    elif '[input]' in current_line:
-                        # Hit next command, don't include this line
-                        i -= 1  # Back up one line
-                        break
-                    else:
-                        # Collect output content, skipping 'received output:' prefix
-                        content = current_line
-                        if content.startswith('received output:'):
-                            content = content[len('received output:'):].lstrip()
-                        if content.strip():  # Only add non-empty lines
-                            output_lines.append(content.rstrip())
-                
-                i += 1
-            
-            # Join all output lines to create the response
-            if output_lines:
-                response = '\n'.join(output_lines)
-                ldapsearch_operations.append({
-                    'command': command,
-                    'response': response
-                })
-                print(f"Extracted ldapsearch operation with {len(output_lines)} lines of output")
-        
-        i += 1
-    
-    return ldapsearch_operations
+                        print(f"Found end of ldapsearch at line {line_number}: {current_line.strip()}")
+                        yield from _make_operation(command, output_lines)
+                        command = None
+                        continue
+
+                    if '[input]' in current_line:
+                        # Hit next command; finish this operation without the
+                        # line and let it be checked as a new command below
+                        yield from _make_operation(command, output_lines)
+                        command = None
+
+                if command is not None:
+                    # Collect output content, skipping 'received output:' prefix
+                    content = current_line
+                    if content.startswith('received output:'):
+                        content = content[len('received output:'):].lstrip()
+                    if content.strip():  # Only add non-empty lines
+                        output_lines.append(content.rstrip())
+                    continue
+
+            # Look for ldapsearch input command; the marker has no surrounding
+            # whitespace, so only matching lines need stripping
+            if LDAPSEARCH_INPUT_MARKER in current_line:
+                line = current_line.strip()
+                print(f"Found ldapsearch command at line {line_number}: {line}")
+
+                # Extract the command for reference
+                command = line.split(COMMAND_PREFIX)[1]
+                collecting_output = False
+                output_lines = []
+
+    if command is not None:
+        yield from _make_operation(command, output_lines)
+
 
+def _make_operation(command: str, output_lines: List[str]) -> Iterator[Dict[str, str]]:
+    """Yield an ldapsearch operation if it produced any output."""
+    # Join all output lines to create the response
+    if output_lines:
+        response = '\n'.join(output_lines)
+        print(f"Extracted ldapsearch operation with {len(output_lines)} lines of output")
+        yield {
+            'command': command,
+            'response': response
+        }
 
-def convert_to_outflankc2_json(ldapsearch_operations: List[Dict[str, str]], output_file: str):
+
+def convert_to_outflankc2_json(ldapsearch_operations: Iterable[Dict[str, str]],
+                               output_file: str) -> int:
     """
     Convert extracted ldapsearch operations to OutflankC2 JSON format.
     
     Args:
-        ldapsearch_operations: List of ldapsearch operations
+        ldapsearch_operations: Iterable of ldapsearch operations
         output_file: Path to output JSON file
+
+    Returns:
+        Number of operations written
     """
+    written = 0
     timestamp = "2025-01-01 12:30:32 UTC"
     
-    with open(output_file, 'w', encoding='utf-8') as f:
+    with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
         for i, operation in enumerate(ldapsearch_operations):
             # Create the OutflankC2 JSON structure
             json_obj = {
@@ -109,10 +130,12 @@ def convert_to_outflankc2_json(ldapsearch_operations: List[Dict[str, str]], outp
             }
             
             # Write as single line JSON with timestamp prefix
-            json_line = f'{timestamp} {json.dumps(json_obj, separators=(",", ":"))}'
-            f.write(json_line + '\n')
+            f.write(f'{timestamp} {json.dumps(json_obj, separators=(",", ":"))}\n')
             
             print(f"Wrote ldapsearch operation {i + 1} to JSON file")
+            written = i + 1
+
+    return written
 
 
 def main():
@@ -127,20 +150,23 @@ def main():
         print(f"Error: Input file {input_file} does not exist")
         return
     
-    # Parse the beacon log
+    # Parse the beacon log; operations are written out as they are read, so
+    # only one is held in memory at a time
     ldapsearch_operations = parse_beacon_log(input_file)
-    
-    if not ldapsearch_operations:
+
+    # Don't create the output file unless there is something to write
+    first_operation = next(ldapsearch_operations, None)
+    if first_operation is None:
         print("No ldapsearch operations found in the beacon log")
         return
     
-    print(f"Found {len(ldapsearch_operations)} ldapsearch operations")
-    
     # Convert to OutflankC2 JSON format
-    convert_to_outflankc2_json(ldapsearch_operations, output_file)
+    written = convert_to_outflankc2_json(
+        chain([first_operation], ldapsearch_operations), output_file
+    )
     
     print(f"Conversion complete! Output written to {output_file}")
-    print(f"Generated {len(ldapsearch_operations)} JSON entries")
+    print(f"Generated {written} JSON entries")
 
 
 if __name__ == "__main__":
@@ -4,107 +4,156 @@ import json
 import asyncio
 import logging
 from typing import AsyncIterator, Iterator, TypeVar
-from mythic import mythic
+from mythic import mythic, graphql_queries
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 T = TypeVar('T')
 
-async def get_all_task_outputs_async(mythic_instance):
-    """Async generator that gets all outputs by fetching fixed-size batches until exhausted."""
+logger = logging.getLogger(__name__)
 
-    batch_size = 7  # Fixed reasonable batch size
-    offset = 0  # Track how many we've processed
+MAX_CONCURRENT_REQUESTS = 16
 
-    while True:
-        print(f"Fetching batch starting at offset {offset}")
+# Outputs requested per get_all_task_output round trip; memory held per batch
+# grows linearly with this
+OUTPUT_BATCH_SIZE = 256
 
-        # Get current batch - but how do we specify offset?
-        # This is where we hit the API limitation again...
-        output_generator = mythic.get_all_task_output(mythic_instance, batch_size=batch_size)
+# Number of tasks whose outputs are fetched by one query, and so held in
+# memory before being written to disk
+TASKS_PER_OUTPUT_QUERY = 500
+
+# Task columns kept in a capture; the default task_fragment also returns
+# original_params and display_params, which can be large and nothing reads
+TASK_RETURN_ATTRIBUTES = (
+    "id,display_id,callback { id,display_id },command_name,status,completed,timestamp"
+)
+
+TASK_OUTPUTS_QUERY = f"""
+query TaskResponses($task_display_ids: [Int!]!){{
+    response(order_by: {{id: asc}}, where: {{task:{{display_id: {{_in: $task_display_ids}}}}}}) {{
+        ...task_output_fragment
+    }}
+}}
+{graphql_queries.task_output_fragment}
+"""
 
-        batch_items = []
-        outputs = []
-        async for item in output_generator:
-            for output in item:
-                print(
-                    f"Fetched item with task display_id: {output.get('task', {}).get('display_id')}"
-                )
-                outputs.append(output)
-            batch_items.append(item)
 
-        print(f"Got {len(outputs)} outputs from {len(batch_items)} batches")
+def dumps_json(data) -> bytes:
+    """Serialize data to indented JSON as UTF-8 bytes."""
+    # orjson is optional; it pretty-prints large captures many times faster
+    # than the stdlib and returns bytes that are written in one call
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
 
-        # If we got no items, we're done
-        if not batch_items:
-            break
+    return json.dumps(data, indent=2).encode('utf-8')
 
-        # Yield items from this batch
-        for item in batch_items:
-            yield item
 
-        offset += len(batch_items)
+def write_json(data, output_file):
+    """Write captured data to output_file as indented JSON."""
+    with open(output_file, 'wb') as f:
+        f.write(dumps_json(data))
 
-        # If we got fewer items than batch_size, we've reached the end
-        if len(batch_items) < batch_size:
-            break
 
-def async_iterable_to_sync_iterable(iterator: AsyncIterator[T]) -> Iterator[T]:
-    """Convert an async iterator to a sync iterator."""
-    loop = asyncio.get_event_loop()
+async def get_all_task_outputs_async(mythic_instance, batch_size=OUTPUT_BATCH_SIZE):
+    """Async generator that streams all outputs in fixed-size batches."""
+
+    # get_all_task_output already pages through every output, so a single
+    # pass sees each batch exactly once
+    output_generator = mythic.get_all_task_output(mythic_instance, batch_size=batch_size)
+
+    num_batches = 0
+    num_outputs = 0
+    async for item in output_generator:
+        # Per-output tracing is debug-only; skip walking the batch entirely
+        # unless someone is listening
+        if logger.isEnabledFor(logging.DEBUG):
+            for output in item:
+                logger.debug(
+                    "Fetched item with task display_id: %s",
+                    output.get('task', {}).get('display_id')
+                )
+        num_outputs += len(item)
+        num_batches += 1
+        yield item
+
+    print(f"Got {num_outputs} outputs from {num_batches} batches")
+
+def async_iterable_to_sync_iterable(iterator: AsyncIterator[T], loop=None) -> Iterator[T]:
+    """
+    Convert an async iterator to a sync iterator, driven on `loop`. Without a
+    loop, a private one is created for the iteration and closed afterwards.
+    """
+    # Drive the whole iteration on one loop, as MythicDataSource does;
+    # asyncio.get_event_loop() is deprecated outside a running loop, and
+    # closing the loop it returns would break any later caller sharing it
+    owns_loop = loop is None
+    if owns_loop:
+        loop = asyncio.new_event_loop()
 
     try:
         while True:
             try:
                 result = loop.run_until_complete(anext(iterator))
-                print("🟡 async_iterable_to_sync_iterable:")
+                logger.debug("async_iterable_to_sync_iterable: got item")
                 yield result
             except StopAsyncIteration:
-                print("🟡 async_iterable_to_sync_iterable: StopAsyncIteration")
+                logger.debug("async_iterable_to_sync_iterable: StopAsyncIteration")
                 break
     finally:
-        loop.close()
+        if owns_loop:
+            loop.close()
 
-def get_all_task_outputs_sync(mythic_instance):
+def get_all_task_outputs_sync(mythic_instance, batch_size=OUTPUT_BATCH_SIZE, loop=None):
     """
     Sync generator that properly streams outputs from Mythic
     """
-    batch_size = 1
-
     # Get all outputs in one go, then yield them
     async_output_iterator = mythic.get_all_task_output(mythic_instance, batch_size=batch_size)
-    for output in async_iterable_to_sync_iterable(async_output_iterator):
+    for output in async_iterable_to_sync_iterable(async_output_iterator, loop):
         yield output
 
-def get_data_streams(mythic_instance):
-    """Sync generator that streams all outputs using exponentially increasing batch sizes."""
+def get_data_streams(mythic_instance, batch_size=OUTPUT_BATCH_SIZE):
+    """Sync generator that streams all outputs from a single pass over Mythic."""
 
-    async def _get_batch_generator(batch_size):
-        """Get one batch of the specified size."""
-        batch_generator = mythic.get_all_task_output(mythic_instance, batch_size=batch_size)
-        return [item async for item in batch_generator]
+    # One generator pages through every output; restarting it with larger
+    # batch sizes would refetch everything already yielded
+    output_generator = mythic.get_all_task_output(mythic_instance, batch_size=batch_size)
 
-    batch_size = 5
     yielded_count = 0
+    for item in async_iterable_to_sync_iterable(output_generator):
+        yield item
+        yielded_count += 1
 
-    while True:
-        print(f"Fetching batch of size {batch_size}")
+    print(f"Got all data. Total items: {yielded_count}")
 
-        # Get current batch
-        batch_items = asyncio.run(_get_batch_generator(batch_size))
-
-        print(f"Got {len(batch_items)} batches")
+async def get_task_outputs_by_ids(mythic_instance, task_display_ids):
+    """
+    Get the outputs of several tasks with a single query. Returns one list of
+    outputs per task, in the order the task ids were given.
+    """
+    result = await mythic.execute_custom_query(
+        mythic_instance,
+        TASK_OUTPUTS_QUERY,
+        {"task_display_ids": task_display_ids}
+    )
 
-        # Yield items from this batch (but only new ones beyond what we've already yielded)
-        new_items = batch_items[yielded_count:]
+    outputs_by_task = {display_id: [] for display_id in task_display_ids}
+    for output in result["response"]:
+        outputs_by_task[output["task"]["display_id"]].append(output)
+    return list(outputs_by_task.values())
 
-        for item in new_items:
-            yield item
+async def gather_bounded(coroutines, limit=MAX_CONCURRENT_REQUESTS):
+    """Await coroutines concurrently, at most `limit` at a time, keeping their order."""
+    semaphore = asyncio.Semaphore(limit)
 
-        yielded_count += len(new_items)
+    async def bounded(coroutine):
+        async with semaphore:
+            return await coroutine
 
-        # If we got fewer items than batch_size, we have everything
-        if len(batch_items) < batch_size:
-            print(f"Got all data. Total items: {yielded_count}")
-            break
+    return await asyncio.gather(*(bounded(coroutine) for coroutine in coroutines))
 
 async def capture_mythic_data(server, token, output_file):
     """Capture real Mythic data for testing purposes."""
@@ -118,40 +167,48 @@ async def capture_mythic_data(server, token, output_file):
         logging_level=logging.CRITICAL,
     )
 
-    captured_data = {
-        "callbacks": [],
-        "tasks": [],
-        "outputs": []
-    }
-
     # Capture callback metadata
     raw_callbacks = await mythic.get_all_callbacks(
         mythic_instance,
         custom_return_attributes="id,display_id,domain,user,host,agent_callback_id"
     )
 
-    captured_data["callbacks"].extend(raw_callbacks)
-
-    # Capture task data and outputs
-    for callback in raw_callbacks:
-        tasks = await mythic.get_all_tasks(
+    # Capture task data; the per-callback queries are independent, so issue
+    # them concurrently instead of one round trip at a time
+    tasks_per_callback = await gather_bounded(
+        mythic.get_all_tasks(
             mythic_instance,
+            custom_return_attributes=TASK_RETURN_ATTRIBUTES,
             callback_display_id=callback["display_id"]
         )
-        captured_data["tasks"].extend(tasks)
-
-        for task in tasks:
-            outputs = await mythic.get_all_task_output_by_id(
+        for callback in raw_callbacks
+    )
+    tasks = [task for callback_tasks in tasks_per_callback for task in callback_tasks]
+
+    # Outputs make up the bulk of a capture, so instead of collecting them all
+    # before saving, fetch them for a chunk of tasks at a time, one query per
+    # chunk rather than one per task, and write each chunk out before
+    # requesting the next
+    num_outputs = 0
+    with open(output_file, 'wb') as f:
+        f.write(b'{\n"callbacks": ' + dumps_json(raw_callbacks))
+        f.write(b',\n"tasks": ' + dumps_json(tasks))
+        f.write(b',\n"outputs": [')
+
+        for start in range(0, len(tasks), TASKS_PER_OUTPUT_QUERY):
+            outputs_per_task = await get_task_outputs_by_ids(
                 mythic_instance,
-                task["display_id"]
+                [task["display_id"] for task in tasks[start:start + TASKS_PER_OUTPUT_QUERY]]
             )
-            captured_data["outputs"].extend(outputs)
+            for outputs in outputs_per_task:
+                for output in outputs:
+                    f.write(b',\n' if num_outputs else b'\n')
+                    f.write(dumps_json(output))
+                    num_outputs += 1
 
-    # Save to JSON
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(captured_data, f, indent=2)
+        f.write(b'\n]\n}\n')
 
-    print(f"Captured data for {len(captured_data['callbacks'])} callbacks")
+    print(f"Captured data for {len(raw_callbacks)} callbacks")
     print(f"Saved to {output_file}")
 
 async def get_output(server, token, output_file="outputs.json"):
@@ -170,33 +227,39 @@ async def get_output(server, token, output_file="outputs.json"):
     # for output in get_data_streams(mythic_instance):
     #     output_data.extend(output)
 
-    async for output in get_all_task_outputs_async(mythic_instance):
-        output_data.append(output)
+    # Outputs arrive a batch at a time; extend with the whole batch so the
+    # saved list is flat, matching get_output_sync
+    async for batch in get_all_task_outputs_async(mythic_instance):
+        output_data.extend(batch)
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2)
+    write_json(output_data, output_file)
 
 def get_output_sync(server, token, output_file="outputs.json"):
     """Capture real Mythic data for testing purposes."""
 
-    # Connect and get real data
-    mythic_instance = sync(mythic.login(
-        apitoken=token,
-        server_ip=server,
-        server_port=7443,
-        timeout=-1,
-        logging_level=logging.CRITICAL,
-    ))
-
-    output_data = []
-    # for output in get_data_streams(mythic_instance):
-    #     output_data.extend(output)
-
-    for output in get_all_task_outputs_sync(mythic_instance):
-        output_data.extend(output)
+    # Log in and stream the outputs on the same loop, so the session created
+    # at login is never used from a loop other than the one it was bound to
+    loop = asyncio.new_event_loop()
+    try:
+        # Connect and get real data
+        mythic_instance = loop.run_until_complete(mythic.login(
+            apitoken=token,
+            server_ip=server,
+            server_port=7443,
+            timeout=-1,
+            logging_level=logging.CRITICAL,
+        ))
+
+        output_data = []
+        # for output in get_data_streams(mythic_instance):
+        #     output_data.extend(output)
+
+        for output in get_all_task_outputs_sync(mythic_instance, loop=loop):
+            output_data.extend(output)
+    finally:
+        loop.close()
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2)
+    write_json(output_data, output_file)
 
 # Usage
 # Get server token and output file from command line or config